@@ -35,6 +35,7 @@ class Database:
                     is_recurring BOOLEAN DEFAULT FALSE,
                     frequency VARCHAR(20),
                     next_due_date DATE,
+                    currency VARCHAR(3) DEFAULT 'USD',
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 );
                 
@@ -44,8 +45,12 @@ class Database:
                     amount DECIMAL(10,2) NOT NULL,
                     payment_date DATE NOT NULL,
                     notes TEXT,
+                    currency VARCHAR(3) DEFAULT 'USD',
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 );
+
+                ALTER TABLE income ADD COLUMN IF NOT EXISTS currency VARCHAR(3) DEFAULT 'USD';
+                ALTER TABLE tithe_payments ADD COLUMN IF NOT EXISTS currency VARCHAR(3) DEFAULT 'USD';
             """)
             self.conn.commit()
 
@@ -79,21 +84,21 @@ class Database:
             """)
             return cur.fetchall()
 
-    def add_tithe_payment(self, user_id, amount, notes):
+    def add_tithe_payment(self, user_id, amount, notes, currency='USD'):
         with self.conn.cursor() as cur:
             cur.execute(
-                "INSERT INTO tithe_payments (user_id, amount, payment_date, notes) VALUES (%s, %s, %s, %s)",
-                (user_id, amount, datetime.now().date(), notes)
+                "INSERT INTO tithe_payments (user_id, amount, payment_date, notes, currency) VALUES (%s, %s, %s, %s, %s)",
+                (user_id, amount, datetime.now().date(), notes, currency)
             )
             self.conn.commit()
 
     def get_income_summary(self, user_id):
         with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute("""
-                SELECT source, SUM(amount) as total
+                SELECT source, currency, SUM(amount) as total
                 FROM income
                 WHERE user_id = %s
-                GROUP BY source
+                GROUP BY source, currency
                 ORDER BY total DESC
             """, (user_id,))
             return cur.fetchall()
@@ -101,7 +106,7 @@ class Database:
     def get_recent_transactions(self, user_id, limit=10):
         with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute("""
-                SELECT amount, source, date, description
+                SELECT amount, currency, source, date, description
                 FROM income
                 WHERE user_id = %s
                 ORDER BY date DESC
@@ -110,22 +115,17 @@ class Database:
             return cur.fetchall()
 
     def get_tithe_status(self, user_id):
+        # Totals per currency; amounts in different currencies are never added together
         with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute("""
-                WITH total_income AS (
-                    SELECT COALESCE(SUM(amount), 0) as income_sum
-                    FROM income
-                    WHERE user_id = %s
-                ),
-                total_payments AS (
-                    SELECT COALESCE(SUM(amount), 0) as payment_sum
-                    FROM tithe_payments
-                    WHERE user_id = %s
-                )
-                SELECT 
-                    (total_income.income_sum * 0.1) as total_tithe_due,
-                    total_payments.payment_sum as total_tithe_paid,
-                    ((total_income.income_sum * 0.9) - total_payments.payment_sum) as remaining_balance
-                FROM total_income, total_payments
+                SELECT 'income' as kind, currency, SUM(amount) as amount
+                FROM income
+                WHERE user_id = %s
+                GROUP BY currency
+                UNION ALL
+                SELECT 'payment' as kind, currency, SUM(amount) as amount
+                FROM tithe_payments
+                WHERE user_id = %s
+                GROUP BY currency
             """, (user_id, user_id))
-            return cur.fetchone()
+            return cur.fetchall()
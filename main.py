@@ -4,9 +4,9 @@ from datetime import datetime
 from database import Database
 from auth import AuthManager
 from utils import (
-    format_currency, calculate_tithe, validate_amount, 
-    INCOME_SOURCES, get_sacred_geometry_style, TITHE_VERSES,
-    SUPPORTED_CURRENCIES
+    validate_amount, INCOME_SOURCES, get_sacred_geometry_style, TITHE_VERSES,
+    SUPPORTED_CURRENCIES, make_ledger, format_currency_column,
+    to_major_units, calculate_tithe_minor, sum_by_currency
 )
 import random
 from visualizations import create_income_distribution_chart, create_tithe_progress_chart
@@ -138,11 +138,12 @@ elif st.session_state.user is not None:
     
     st.markdown("### Record Tithe Payment")
     tithe_amount = st.number_input("Tithe Amount", min_value=0.0, format="%f")
+    tithe_currency = st.selectbox("Tithe Currency", options=list(SUPPORTED_CURRENCIES.keys()), format_func=lambda x: f"{x} - {SUPPORTED_CURRENCIES[x]['name']}")
     notes = st.text_area("Payment Notes")
     
     if st.button("Record Tithe Payment"):
         if tithe_amount > 0:
-            db.add_tithe_payment(st.session_state.user["id"], tithe_amount, notes)
+            db.add_tithe_payment(st.session_state.user["id"], tithe_amount, notes, tithe_currency)
             verse = random.choice(TITHE_VERSES)
             st.success(f"🙏 Tithe payment recorded successfully! May God bless your faithful giving.\n\n*{verse}*")
         else:
@@ -150,59 +151,75 @@ elif st.session_state.user is not None:
 
 # Main content area - only show when user is logged in
     if st.session_state.authentication_status and st.session_state.user:
-        col1, col2, col3 = st.columns(3)
-
-        # Fetch tithe status
+        # Fetch tithe status; totals are kept per currency in integer minor units
         try:
             tithe_status = db.get_tithe_status(st.session_state.user["id"])
-            if tithe_status:
-                total_tithe_due = float(tithe_status['total_tithe_due'])
-                total_tithe_paid = float(tithe_status['total_tithe_paid'])
-            else:
-                total_tithe_due = 0.0
-                total_tithe_paid = 0.0
         except Exception as e:
             st.error(f"Error fetching tithe status: {str(e)}")
-            total_tithe_due = 0.0
-            total_tithe_paid = 0.0
-
-# Display metrics
-        with col1:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.markdown('<div class="metric-label">Total Tithe Due</div>', unsafe_allow_html=True)
-            st.markdown(f'<div class="metric-value">{format_currency(total_tithe_due)}</div>', unsafe_allow_html=True)
-            st.markdown('</div>', unsafe_allow_html=True)
-
-        with col2:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.markdown('<div class="metric-label">Total Tithe Paid</div>', unsafe_allow_html=True)
-            st.markdown(f'<div class="metric-value">{format_currency(total_tithe_paid)}</div>', unsafe_allow_html=True)
-            st.markdown('</div>', unsafe_allow_html=True)
-
-        with col3:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.markdown('<div class="metric-label">Remaining Balance</div>', unsafe_allow_html=True)
-            remaining_balance = float(tithe_status['remaining_balance'])
-            st.markdown(f'<div class="metric-value">{format_currency(remaining_balance)}</div>', unsafe_allow_html=True)
-            st.markdown('</div>', unsafe_allow_html=True)
+            tithe_status = None
+        if tithe_status:
+            status = make_ledger(tithe_status)
+            income_totals = sum_by_currency(status[status['kind'] == 'income'])
+            paid_totals = sum_by_currency(status[status['kind'] == 'payment'])
+            currencies = income_totals.index.union(paid_totals.index)
+            totals = pd.DataFrame({
+                'income': income_totals.reindex(currencies, fill_value=0),
+                'paid': paid_totals.reindex(currencies, fill_value=0),
+            })
+        else:
+            totals = pd.DataFrame({'income': [0], 'paid': [0]}, index=['USD'])
+        totals['due'] = calculate_tithe_minor(totals['income'])
+        totals['remaining'] = totals['income'] - totals['due'] - totals['paid']
+        due_labels = format_currency_column(totals['due'], totals.index)
+        paid_labels = format_currency_column(totals['paid'], totals.index)
+        remaining_labels = format_currency_column(totals['remaining'], totals.index)
+
+# Display metrics, one row per currency
+        for currency in totals.index:
+            if len(totals) > 1:
+                st.markdown(f"#### {currency} - {SUPPORTED_CURRENCIES[currency]['name']}")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+                st.markdown('<div class="metric-label">Total Tithe Due</div>', unsafe_allow_html=True)
+                st.markdown(f'<div class="metric-value">{due_labels[currency]}</div>', unsafe_allow_html=True)
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            with col2:
+                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+                st.markdown('<div class="metric-label">Total Tithe Paid</div>', unsafe_allow_html=True)
+                st.markdown(f'<div class="metric-value">{paid_labels[currency]}</div>', unsafe_allow_html=True)
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            with col3:
+                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+                st.markdown('<div class="metric-label">Remaining Balance</div>', unsafe_allow_html=True)
+                st.markdown(f'<div class="metric-value">{remaining_labels[currency]}</div>', unsafe_allow_html=True)
+                st.markdown('</div>', unsafe_allow_html=True)
 
 # Visualizations
         st.markdown("### Income Distribution")
         income_summary = db.get_income_summary(st.session_state.user["id"])
         if income_summary:
-            chart = create_income_distribution_chart(income_summary)
-            st.plotly_chart(chart, use_container_width=True)
+            summary = make_ledger(income_summary, amount_col='total')
+            for currency, sources in summary.groupby('currency', observed=True):
+                chart = create_income_distribution_chart(sources, currency)
+                st.plotly_chart(chart, use_container_width=True)
 
         st.markdown("### Tithe Progress")
-        progress_chart = create_tithe_progress_chart(total_tithe_due, total_tithe_paid)
-        st.plotly_chart(progress_chart, use_container_width=True)
+        for currency in totals.index:
+            tithe_due, tithe_paid = to_major_units(totals.loc[currency, ['due', 'paid']], currency)
+            progress_chart = create_tithe_progress_chart(tithe_due, tithe_paid)
+            st.plotly_chart(progress_chart, use_container_width=True)
 
         # Recurring Income Section
         st.markdown("### 🔄 Recurring Income")
         recurring_incomes = db.get_recurring_income()
         if recurring_incomes:
-            for income in recurring_incomes:
-                with st.expander(f"{income['source']} - {format_currency(income['amount'])} ({income['frequency']})"):
+            recurring_ledger = make_ledger(recurring_incomes)
+            amount_labels = format_currency_column(recurring_ledger['amount'], recurring_ledger['currency'])
+            for income, amount_label in zip(recurring_incomes, amount_labels):
+                with st.expander(f"{income['source']} - {amount_label} ({income['frequency']})"):
                     st.write(f"**Description:** {income['description']}")
                     st.write(f"**Next Due:** {income['next_due_date'].strftime('%Y-%m-%d')}")
                     st.write(f"**Frequency:** {income['frequency']}")
@@ -218,8 +235,8 @@ elif st.session_state.user is not None:
         st.markdown("### Recent Transactions")
         transactions = db.get_recent_transactions(st.session_state.user["id"])
         if transactions:
-            df = pd.DataFrame(transactions)
-            df['amount'] = df['amount'].apply(format_currency)
+            df = make_ledger(transactions)
+            df['amount'] = format_currency_column(df['amount'], df.pop('currency'))
             st.dataframe(df, use_container_width=True)
         else:
             st.info("No transactions recorded yet.")
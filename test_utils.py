@@ -0,0 +1,104 @@
+from decimal import Decimal
+import timeit
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import (
+    calculate_tithe, calculate_tithe_minor, format_currency,
+    format_currency_column, make_ledger, sum_by_currency, to_minor_units
+)
+
+
+@pytest.mark.parametrize("amount", [0, 5, 1234.5, -12.34, 1234567.89, -9876543.21])
+def test_format_currency_column_matches_format_currency_usd(amount):
+    minor = to_minor_units([amount], 'USD')
+    assert format_currency_column(minor, 'USD').tolist() == [format_currency(amount, 'USD')]
+
+
+@pytest.mark.parametrize("amount", [0, 7, 1000, -1500, 123456789])
+def test_format_currency_column_matches_format_currency_jpy(amount):
+    minor = to_minor_units([amount], 'JPY')
+    assert format_currency_column(minor, 'JPY').tolist() == [format_currency(amount, 'JPY')]
+
+
+def test_format_currency_column_empty():
+    assert format_currency_column([]).tolist() == []
+    ledger = make_ledger([])
+    assert format_currency_column(ledger['amount'], ledger['currency']).tolist() == []
+
+
+def test_jpy_fractions_round_half_up():
+    # format_currency truncates (¥1,000); the ledger rounds like every other currency
+    minor = to_minor_units([Decimal('1000.50'), Decimal('1000.49')], 'JPY')
+    assert minor.tolist() == [1001, 1000]
+    assert format_currency_column(minor, 'JPY').tolist() == ['¥1,001', '¥1,000']
+
+
+def test_format_currency_column_mixed_currencies():
+    ledger = make_ledger([
+        {'amount': Decimal('1000.10'), 'currency': 'USD'},
+        {'amount': Decimal('1000'), 'currency': 'JPY'},
+        {'amount': Decimal('0.05'), 'currency': 'EUR'},
+    ])
+    labels = format_currency_column(ledger['amount'], ledger['currency'])
+    assert labels.tolist() == ['$1,000.10', '¥1,000', '€0.05']
+
+
+@pytest.mark.parametrize("minor, tithe", [(15, 2), (-15, -2), (4, 0), (14, 1), (100, 10)])
+def test_calculate_tithe_minor_rounds_half_away_from_zero(minor, tithe):
+    assert calculate_tithe_minor([minor]).tolist() == [tithe]
+
+
+def test_calculate_tithe_is_exact():
+    assert calculate_tithe(Decimal('15.05')) == Decimal('1.51')
+    assert calculate_tithe(1005, 'JPY') == Decimal('101')
+
+
+def test_to_minor_units_converts_decimals_exactly():
+    amounts = [Decimal('0.01'), Decimal('1.005'), Decimal('99999999.99'), Decimal('-2.345')]
+    assert to_minor_units(amounts).tolist() == [1, 101, 9999999999, -235]
+    assert to_minor_units([Decimal('1500')], 'JPY').tolist() == [1500]
+
+
+def test_to_minor_units_floats_go_through_decimal():
+    assert to_minor_units([1.005]).tolist() == [101]
+
+
+def test_to_minor_units_rejects_null():
+    with pytest.raises(ValueError):
+        to_minor_units([Decimal('1'), None])
+
+
+def test_to_minor_units_rejects_overflow():
+    with pytest.raises(ValueError):
+        to_minor_units([Decimal(2 ** 62)])
+
+
+def test_sum_by_currency():
+    ledger = make_ledger([
+        {'amount': Decimal('10.05'), 'currency': 'USD'},
+        {'amount': Decimal('1000'), 'currency': 'JPY'},
+        {'amount': Decimal('0.10'), 'currency': 'USD'},
+    ])
+    totals = sum_by_currency(ledger)
+    assert totals.dtype == 'int64'
+    assert totals.to_dict() == {'USD': 1015, 'JPY': 1000}
+
+
+def test_make_ledger_empty():
+    ledger = make_ledger([])
+    assert len(ledger) == 0
+    assert ledger['amount'].dtype == 'int64'
+    assert ledger['currency'].dtype.name == 'category'
+
+
+@pytest.mark.parametrize("currency", ['USD', 'JPY'])
+def test_format_currency_column_faster_than_per_row(currency):
+    rng = np.random.default_rng(0)
+    amounts = pd.Series(rng.integers(-10 ** 9, 10 ** 9, 50_000) / 100)
+    minor = to_minor_units(amounts, currency)
+    columnar = min(timeit.repeat(lambda: format_currency_column(minor, currency), number=1, repeat=5))
+    per_row = min(timeit.repeat(lambda: amounts.apply(format_currency, currency=currency), number=1, repeat=5))
+    assert columnar < per_row
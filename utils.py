@@ -1,12 +1,15 @@
 import streamlit as st
+import numpy as np
+import pandas as pd
+from decimal import Decimal, ROUND_HALF_UP
 
 SUPPORTED_CURRENCIES = {
-    'USD': {'symbol': '$', 'name': 'US Dollar'},
-    'EUR': {'symbol': '€', 'name': 'Euro'},
-    'GBP': {'symbol': '£', 'name': 'British Pound'},
-    'JPY': {'symbol': '¥', 'name': 'Japanese Yen'},
-    'AUD': {'symbol': 'A$', 'name': 'Australian Dollar'},
-    'CAD': {'symbol': 'C$', 'name': 'Canadian Dollar'},
+    'USD': {'symbol': '$', 'name': 'US Dollar', 'decimals': 2},
+    'EUR': {'symbol': '€', 'name': 'Euro', 'decimals': 2},
+    'GBP': {'symbol': '£', 'name': 'British Pound', 'decimals': 2},
+    'JPY': {'symbol': '¥', 'name': 'Japanese Yen', 'decimals': 0},
+    'AUD': {'symbol': 'A$', 'name': 'Australian Dollar', 'decimals': 2},
+    'CAD': {'symbol': 'C$', 'name': 'Canadian Dollar', 'decimals': 2},
 }
 
 def format_currency(amount, currency='USD'):
@@ -15,8 +18,120 @@ def format_currency(amount, currency='USD'):
         return f"{currency_info['symbol']}{int(amount):,}"
     return f"{currency_info['symbol']}{amount:,.2f}"
 
-def calculate_tithe(amount):
-    return amount * 0.1
+def calculate_tithe(amount, currency='USD'):
+    # Exact 10% of the amount, rounded half away from zero to the currency's minor unit
+    minor = calculate_tithe_minor(to_minor_units([amount], currency))[0]
+    return Decimal(int(minor)).scaleb(-SUPPORTED_CURRENCIES.get(currency, SUPPORTED_CURRENCIES['USD'])['decimals'])
+
+# Ledger columns hold money as int64 minor units (cents, or whole yen for JPY)
+# alongside a categorical currency code. Amounts are converted once when the
+# ledger is built; summing, tithing and formatting then work on whole columns.
+# Conversion rounds half away from zero in every currency, so ¥1000.50 becomes
+# ¥1,001 (format_currency truncates JPY to ¥1,000).
+CURRENCY_DTYPE = pd.CategoricalDtype(categories=list(SUPPORTED_CURRENCIES))
+_DECIMALS = np.array([info['decimals'] for info in SUPPORTED_CURRENCIES.values()], dtype=np.int64)
+_MINOR_SCALES = 10 ** _DECIMALS
+_SYMBOLS = np.array([info['symbol'] for info in SUPPORTED_CURRENCIES.values()])
+_NEGATIVE_SYMBOLS = np.strings.add(_SYMBOLS, '-')
+_DEFAULT_CODE = CURRENCY_DTYPE.categories.get_loc('USD')
+# Zero-padded digit strings, indexed by value, for building formatted amounts
+_DIGIT_GROUPS = np.array([f"{i:03d}" for i in range(1000)])
+_FRACTIONS = {
+    int(places): np.array([f".{i:0{places}d}" for i in range(10 ** places)])
+    for places in np.unique(_DECIMALS) if places > 0
+}
+# Scaled floats at least this large, or this close to a half, may round the
+# wrong way in binary floating point and are converted through Decimal instead
+_FLOAT_EXACT_LIMIT = 2 ** 51
+_FLOAT_HALF_TOLERANCE = 1e-14
+
+def _currency_codes(currencies, length):
+    if isinstance(currencies, str):
+        code = CURRENCY_DTYPE.categories.get_indexer([currencies])[0]
+        return np.full(length, _DEFAULT_CODE if code < 0 else code)
+    codes = pd.Series(currencies).astype(CURRENCY_DTYPE).cat.codes.to_numpy()
+    # Unknown currencies fall back to USD, matching format_currency
+    return np.where(codes < 0, _DEFAULT_CODE, codes)
+
+def to_minor_units(amounts, currencies='USD'):
+    amounts = pd.Series(amounts)
+    if amounts.isna().any():
+        raise ValueError("Ledger amounts must not be null")
+    scales = _MINOR_SCALES[_currency_codes(currencies, len(amounts))]
+    scaled = amounts.to_numpy(dtype=np.float64) * scales
+    if not np.isfinite(scaled).all():
+        raise ValueError(f"Ledger amount out of range: {amounts.iat[np.argmin(np.isfinite(scaled))]}")
+    minor = np.rint(scaled)
+    distance_from_half = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5)
+    inexact = np.flatnonzero(
+        (np.abs(scaled) >= _FLOAT_EXACT_LIMIT)
+        | (distance_from_half <= np.abs(scaled) * _FLOAT_HALF_TOLERANCE)
+    )
+    minor = np.where(np.abs(scaled) < _FLOAT_EXACT_LIMIT, minor, 0).astype(np.int64)
+    # Decimal values from psycopg2 are used as-is, floats via their shortest
+    # repr, so 1.005 becomes 101 cents
+    for i in inexact:
+        exact = (Decimal(str(amounts.iat[i])) * int(scales[i])).to_integral_value(ROUND_HALF_UP)
+        if not exact.is_finite() or not -2 ** 63 < exact < 2 ** 63:
+            raise ValueError(f"Ledger amount out of range: {amounts.iat[i]}")
+        minor[i] = int(exact)
+    return minor
+
+def to_major_units(minor, currencies='USD'):
+    minor = np.asarray(minor, dtype=np.int64)
+    return minor / _MINOR_SCALES[_currency_codes(currencies, len(minor))]
+
+def make_ledger(records, amount_col='amount', currency_col='currency', default_currency='USD'):
+    df = pd.DataFrame(records)
+    if amount_col not in df:
+        return pd.DataFrame({
+            amount_col: pd.Series(dtype=np.int64),
+            currency_col: pd.Series(dtype=CURRENCY_DTYPE),
+        })
+    if currency_col in df:
+        currencies = df[currency_col].fillna(default_currency)
+    else:
+        currencies = pd.Series(default_currency, index=df.index)
+    currencies = pd.Categorical.from_codes(_currency_codes(currencies, len(df)), dtype=CURRENCY_DTYPE)
+    df[currency_col] = currencies
+    df[amount_col] = to_minor_units(df[amount_col], currencies)
+    return df
+
+def calculate_tithe_minor(minor):
+    # 10% in integer arithmetic, rounding half away from zero
+    minor = np.asarray(minor, dtype=np.int64)
+    return np.sign(minor) * ((np.abs(minor) + 5) // 10)
+
+def sum_by_currency(ledger, amount_col='amount', currency_col='currency'):
+    return ledger.groupby(currency_col, observed=True)[amount_col].sum()
+
+def format_currency_column(minor, currencies='USD'):
+    index = minor.index if isinstance(minor, pd.Series) else None
+    minor = np.asarray(minor, dtype=np.int64)
+    if not len(minor):
+        return pd.Series([], index=index, dtype=object)
+    codes = _currency_codes(currencies, len(minor))
+    decimals = _DECIMALS[codes]
+    whole, frac = np.divmod(np.abs(minor), _MINOR_SCALES[codes])
+    # Prepend one comma-separated group of three digits per pass, then strip
+    # the zero padding from the leading group
+    digits = _DIGIT_GROUPS[whole % 1000]
+    whole //= 1000
+    while whole.any():
+        grouped = np.strings.add(np.strings.add(_DIGIT_GROUPS[whole % 1000], ','), digits)
+        digits = np.where(whole > 0, grouped, digits)
+        whole //= 1000
+    digits = np.strings.lstrip(digits, '0')
+    digits = np.where(np.strings.str_len(digits) == 0, '0', digits)
+    # Zero-decimal currencies (JPY) get no fractional part
+    fractions = np.full(len(minor), '')
+    for places, table in _FRACTIONS.items():
+        mask = decimals == places
+        fractions = np.where(mask, table[np.where(mask, frac, 0)], fractions)
+    prefixes = np.where(minor < 0, _NEGATIVE_SYMBOLS[codes], _SYMBOLS[codes])
+    return pd.Series(
+        np.strings.add(np.strings.add(prefixes, digits), fractions), index=index, dtype=object
+    )
 
 def validate_amount(amount_str):
     try:
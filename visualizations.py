@@ -1,14 +1,16 @@
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
+from utils import to_major_units
 
-def create_income_distribution_chart(income_data):
-    df = pd.DataFrame(income_data)
+def create_income_distribution_chart(income_ledger, currency='USD'):
+    # One currency per chart so slice sizes are comparable
+    df = income_ledger.assign(total=to_major_units(income_ledger['total'], currency))
     fig = px.pie(
         df,
         values='total',
         names='source',
-        title='Income Distribution by Source',
+        title=f'Income Distribution by Source ({currency})',
         color_discrete_sequence=px.colors.sequential.Purples,
         hole=0.4
     )